@@ -0,0 +1,28 @@
+import os
+import time
+from pathlib import Path
+
+from tsdat.config.utils import read_yaml
+
+
+def test_read_yaml_returns_a_fresh_copy(tmp_path: Path):
+    filepath = tmp_path / "config.yaml"
+    filepath.write_text("a: 1\n")
+
+    result = read_yaml(filepath)
+    assert result == {"a": 1}
+
+    # Mutating the returned dict must not poison the cache
+    result["a"] = 100
+    assert read_yaml(filepath) == {"a": 1}
+
+
+def test_read_yaml_cache_invalidated_when_file_changes(tmp_path: Path):
+    filepath = tmp_path / "config.yaml"
+    filepath.write_text("a: 1\n")
+    assert read_yaml(filepath) == {"a": 1}
+
+    filepath.write_text("a: 2\n")
+    future = time.time() + 10  # guard against coarse filesystem mtime resolution
+    os.utime(filepath, (future, future))
+    assert read_yaml(filepath) == {"a": 2}
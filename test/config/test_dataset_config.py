@@ -363,6 +363,18 @@ def test_dataset_definition_from_yaml():
     assert model_dict == expected
 
 
+def test_dataset_config_variable_names_are_cached():
+    model = DatasetConfig.from_yaml(Path("test/config/yaml/dataset.yaml"))
+    assert model.variable_names == ["time", "first", "pi"]
+    assert model.variable_names is model.variable_names  # cached after first access
+
+
+def test_dataset_config_variable_attrs_are_cached():
+    model = DatasetConfig.from_yaml(Path("test/config/yaml/dataset.yaml"))
+    assert model.variable_attrs["first"] == {"units": "degC", "_FillValue": -9999.0}
+    assert model.variable_attrs is model.variable_attrs  # cached after first access
+
+
 def test_dataset_config_can_generate_schema():
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp_file = Path(tmpdir) / "dataset-schema.json"
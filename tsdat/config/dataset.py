@@ -1,15 +1,17 @@
 import logging
 import re
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import (
     Extra,
     Field,
+    PrivateAttr,
     root_validator,
     validator,
 )
 from pydantic.fields import ModelField
 
+from ..utils import model_to_dict
 from .attributes import GlobalAttributes
 from .utils import YamlModel
 from .variables import Coordinate, Variable
@@ -19,6 +21,8 @@ __all__ = ["DatasetConfig"]
 
 logger = logging.getLogger(__name__)
 
+_VARIABLE_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_\(\)\/\[\]\{\}\.]+$")
+
 
 class DatasetConfig(YamlModel, extra=Extra.forbid):
     """---------------------------------------------------------------------------------
@@ -61,6 +65,32 @@ class DatasetConfig(YamlModel, extra=Extra.forbid):
         " and set dynamically via user code in a tsdat pipeline.",
     )
 
+    _variable_names: Optional[List[str]] = PrivateAttr(default=None)
+    _variable_attrs: Optional[Dict[str, Dict[str, Any]]] = PrivateAttr(default=None)
+
+    @property
+    def variable_names(self) -> List[str]:
+        """Returns the names of all coords and data_vars, in configuration order.
+
+        The coords and data_vars mappings are not modified after the config is
+        validated, so the list is built once and cached. Treat it as read-only."""
+        if self._variable_names is None:
+            self._variable_names = list(self.coords) + list(self.data_vars)
+        return self._variable_names
+
+    @property
+    def variable_attrs(self) -> Dict[str, Dict[str, Any]]:
+        """Maps each coord and data_var name to its flattened attrs dictionary.
+
+        Flattening the pydantic attribute models is relatively expensive and the
+        results never change after the config is validated, so they are computed once
+        and cached. Treat the returned dictionaries as read-only."""
+        if self._variable_attrs is None:
+            self._variable_attrs = {
+                name: model_to_dict(self[name].attrs) for name in self.variable_names
+            }
+        return self._variable_attrs
+
     @validator("coords")
     @classmethod
     def time_in_coords(cls, coords: Dict[str, Coordinate]) -> Dict[str, Coordinate]:
@@ -73,11 +103,10 @@ class DatasetConfig(YamlModel, extra=Extra.forbid):
         cls, vars: Dict[str, Variable], field: ModelField
     ) -> Dict[str, Variable]:
         for name in vars.keys():
-            pattern = re.compile(r"^[a-zA-Z0-9_\(\)\/\[\]\{\}\.]+$")
-            if not pattern.match(name):
+            if not _VARIABLE_NAME_PATTERN.match(name):
                 raise ValueError(
                     f"'{name}' is not a valid '{field.name}' name. It must be a value"
-                    f" matched by {pattern}."
+                    f" matched by {_VARIABLE_NAME_PATTERN}."
                 )
         return vars
 
@@ -104,15 +133,12 @@ class DatasetConfig(YamlModel, extra=Extra.forbid):
         return values
 
     def __getitem__(self, name: str) -> Union[Variable, Coordinate]:
-        property: Union[Variable, Coordinate]
-        try:
-            property = self.data_vars[name]
-        except KeyError:
-            try:
-                property = self.coords[name]
-            except KeyError:
-                logger.error("Key '%s' is neither a data_var nor a coord.", name)
-                raise
+        property = self.data_vars.get(name)
+        if property is None:
+            property = self.coords.get(name)
+        if property is None:
+            logger.error("Key '%s' is neither a data_var nor a coord.", name)
+            raise KeyError(name)
         return property
 
     def __contains__(self, __o: object) -> bool:
@@ -1,6 +1,8 @@
 import os
 import yaml
 import warnings
+from copy import deepcopy
+from functools import lru_cache
 from jsonpointer import set_pointer  # type: ignore
 from dunamai import Style, Version
 from pathlib import Path
@@ -191,7 +193,10 @@ def recursive_instantiate(model: Any) -> Any:
     if isinstance(model, ParameterizedConfigClass):
         fields = model.__fields_set__ - {"classname"}  # No point checking classname
         for field in fields:
-            setattr(model, field, recursive_instantiate(getattr(model, field)))
+            old = getattr(model, field)
+            new = recursive_instantiate(old)
+            if new is not old:  # Skip pydantic setattr machinery if nothing changed
+                setattr(model, field, new)
         model = model.instantiate()
 
     # Case: BaseModel. Want to instantiate any sub-models then return the model itself.
@@ -203,7 +208,10 @@ def recursive_instantiate(model: Any) -> Any:
                 " extend ParametrizedConfigClass."
             )
         for field in fields:
-            setattr(model, field, recursive_instantiate(getattr(model, field)))
+            old = getattr(model, field)
+            new = recursive_instantiate(old)
+            if new is not old:  # Skip pydantic setattr machinery if nothing changed
+                setattr(model, field, new)
 
     # Case: List. Want to iterate through and recursively instantiate all sub-models in
     # the list, then return everything as a list.
@@ -241,8 +249,23 @@ def find_duplicates(entries: Sequence[_NamedClass]) -> List[str]:
     return duplicates
 
 
+# Use the libyaml C bindings when PyYAML was built with them; they parse the same
+# yaml many times faster than the pure-python SafeLoader.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _read_yaml_cached(filepath: str, last_modified: float) -> Dict[Any, Any]:
+    text = Path(filepath).read_text(encoding="UTF-8")
+    return list(yaml.load_all(text, Loader=_YAML_SAFE_LOADER))[0]
+
+
 def read_yaml(filepath: Path) -> Dict[Any, Any]:
-    return list(yaml.safe_load_all(filepath.read_text(encoding="UTF-8")))[0]
+    # Configs are commonly re-read across pipeline invocations and tests, so parsed
+    # results are cached keyed on modification time, which invalidates stale entries
+    # if the file changes. A deep copy is returned because callers may mutate the
+    # result (e.g., to apply overrides).
+    return deepcopy(_read_yaml_cached(str(filepath), os.path.getmtime(filepath)))
 
 
 def get_code_version() -> str:
@@ -23,6 +23,18 @@ __all__ = [
     "Coordinate",
 ]
 
+# Default _FillValue by dtype. Computed once per dtype instead of once per variable so
+# that validating configs with many variables doesn't repeatedly allocate numpy arrays.
+_DEFAULT_FILL_VALUES: Dict[str, Any] = {}
+
+
+def _default_fill_value(dtype: str) -> Any:
+    fill_value = _DEFAULT_FILL_VALUES.get(dtype)
+    if fill_value is None:
+        fill_value = np.array([-9999.0], dtype=dtype)[0]  # type: ignore
+        _DEFAULT_FILL_VALUES[dtype] = fill_value
+    return fill_value
+
 
 class VariableAttributes(AttributeModel):
     """Attributes that will be recorded in the output dataset.
@@ -207,7 +219,7 @@ class Variable(BaseModel, extra=Extra.forbid):
             or ("datetime" in dtype)
         ):
             return attrs
-        attrs.fill_value = np.array([-9999.0], dtype=dtype)[0]  # type: ignore
+        attrs.fill_value = _default_fill_value(dtype)
         return attrs
 
 
@@ -145,15 +145,20 @@ class ArchiveReader(DataReader):
     ------------------------------------------------------------------------------------
     """
 
+    class Parameters(BaseModel, extra=Extra.forbid):
+        exclude: List[str] = []
+
     exclude: str = ""
 
+    parameters: Parameters = Parameters()
+
     def __init__(self, parameters: Dict = None):  # type: ignore
-        super().__init__(parameters=parameters)
+        super().__init__(parameters=parameters or {})
 
         # Naively merge a list of regex patterns to exclude certain files from being
         # read. By default we exclude files that macOS creates when zipping a folder.
         exclude = [".*\\_\\_MACOSX/.*", ".*\\.DS_Store"]
-        exclude.extend(getattr(self.parameters, "exclude", []))
+        exclude.extend(self.parameters.exclude)
         self.parameters.exclude = "(?:% s)" % "|".join(exclude)
 
 
@@ -5,7 +5,7 @@ import tarfile
 from io import BytesIO
 from zipfile import ZipFile
 from pydantic import BaseModel, Extra
-from typing import Any, Dict, List
+from typing import Any, Dict
 from .base import DataReader, ArchiveReader
 
 __all__ = [
@@ -132,11 +132,10 @@ class TarReader(ArchiveReader):
     ------------------------------------------------------------------------------------
     """
 
-    class Parameters(BaseModel, extra=Extra.forbid):
+    class Parameters(ArchiveReader.Parameters):
         open_tar_kwargs: Dict[str, Any] = {}
         read_tar_kwargs: Dict[str, Any] = {}
         readers: Dict[str, Any] = {}
-        exclude: List[str] = []
 
     parameters: Parameters = Parameters()
 
@@ -237,11 +236,10 @@ class ZipReader(ArchiveReader):
     ------------------------------------------------------------------------------------
     """
 
-    class Parameters(BaseModel, extra=Extra.forbid):
+    class Parameters(ArchiveReader.Parameters):
         open_zip_kwargs: Dict[str, Any] = {}
         read_zip_kwargs: Dict[str, Any] = {}
         readers: Dict[str, Any] = {}
-        exclude: List[str] = []
 
     parameters: Parameters = Parameters()
 
@@ -47,6 +47,8 @@ logger = logging.getLogger(__name__)
 class InputKeyRetrievalRules:
     """Gathers variable retrieval rules for the given input key."""
 
+    __slots__ = ("input_key", "coords", "data_vars")
+
     def __init__(
         self,
         input_key: InputKey,
@@ -81,6 +83,8 @@ class StorageRetrieverInput:
     ```
     """
 
+    __slots__ = ("input_key", "datastream", "_start", "_end", "start", "end", "kwargs")
+
     def __init__(self, input_key: str):
         kwargs: Dict[str, str] = {}
 
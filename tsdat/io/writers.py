@@ -52,25 +52,24 @@ class NetCDFWriter(FileWriter):
         to_netcdf_kwargs["encoding"] = encoding_dict
 
         for variable_name in cast(Iterable[str], dataset.variables):
+            variable = dataset[variable_name]
+
             # Encoding options: https://unidata.github.io/netcdf4-python/#Dataset.createVariable
             # For some reason contiguous=True and chunksizes=None is incompatible with compression
-            if hasattr(dataset[variable_name], "encoding"):
-                if "contiguous" in dataset[variable_name].encoding:
-                    dataset[variable_name].encoding.pop("contiguous")
-                if "chunksizes" in dataset[variable_name].encoding:
-                    dataset[variable_name].encoding.pop("chunksizes")
+            variable.encoding.pop("contiguous", None)
+            variable.encoding.pop("chunksizes", None)
 
             # Prevent Xarray from setting 'nan' as the default _FillValue
-            encoding_dict[variable_name] = dataset[variable_name].encoding.copy()  # type: ignore
+            encoding_dict[variable_name] = variable.encoding.copy()  # type: ignore
             if (
                 "_FillValue" not in encoding_dict[variable_name]
-                and "_FillValue" not in dataset[variable_name].attrs
+                and "_FillValue" not in variable.attrs
             ):
                 encoding_dict[variable_name]["_FillValue"] = None
 
             if self.parameters.compression_level:
                 # Handle str dtypes: https://github.com/pydata/xarray/issues/2040
-                if dataset[variable_name].dtype.kind == "U":
+                if variable.dtype.kind == "U":
                     encoding_dict[variable_name]["dtype"] = "S1"
 
                 encoding_dict[variable_name].update(
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 import xarray as xr
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from getpass import getuser
 from datetime import datetime
 from typing import Any, Iterable, List, Pattern, cast
@@ -67,9 +68,7 @@ class Pipeline(ParameterizedClass, ABC):
             DatasetConfig.
 
         -----------------------------------------------------------------------------"""
-        output_vars = list(self.dataset_config.coords) + list(
-            self.dataset_config.data_vars
-        )
+        output_vars = self.dataset_config.variable_names
         retrieved_variables = cast(List[str], list(dataset.variables))
         vars_to_drop = [ret for ret in retrieved_variables if ret not in output_vars]
         vars_to_add = [out for out in output_vars if out not in retrieved_variables]
@@ -112,9 +111,12 @@ class Pipeline(ParameterizedClass, ABC):
         global_attrs = model_to_dict(self.dataset_config.attrs)
         dataset.attrs.update(**global_attrs)
 
+        # Deep copy the cached attrs so in-place edits to mutable attr values (e.g.,
+        # appending to a list attr) on one output dataset cannot leak into the cache
+        # and corrupt the attrs of datasets produced by later runs.
+        variable_attrs = self.dataset_config.variable_attrs
         for name in output_vars:
-            var_attrs = model_to_dict(self.dataset_config[name].attrs)
-            dataset[name].attrs.update(var_attrs)
+            dataset[name].attrs.update(deepcopy(variable_attrs[name]))
 
         history = f"Ran by {getuser()} at {datetime.now().isoformat()}"
         dataset.attrs["history"] = history
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Callable, Mapping, Match
 
 __all__ = ("Template",)
@@ -90,10 +91,14 @@ def _substitute(
     return resolved
 
 
+@lru_cache(maxsize=None)
 def _generate_regex(template: str) -> str:
     """Generates a regex pattern which can be used to extract the values substituted
     into a template string.
 
+    The result is cached since Template objects are frequently constructed from the
+    same small set of template strings (e.g., storage path and filename templates).
+
     Args:
         template (str): The template string to generate a regex pattern for.
 
@@ -263,6 +268,8 @@ class Template:
             automatically if not provided.
     """
 
+    __slots__ = ("template", "regex")
+
     def __init__(self, template: str, regex: str | None = None) -> None:
         """"""
         if not self._is_balanced(template):